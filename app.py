@@ -1,3 +1,5 @@
+import io
+
 import streamlit as st
 import numpy as np
 import math
@@ -6,16 +8,210 @@ import math
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.patches import Polygon
 
-from scipy import stats
-import pandas as pd
+from fastnorm import INV_SQRT2PI as _INV_SQRT2PI, cdf as _ncdf, pdf as norm_pdf
 
 # Set page config
 st.set_page_config(page_title="MathCraft | Interactive Normal Distribution", layout="wide")
 
+# Plot-grid resolution; power of two, smooth at rendered figure widths.
+PLOT_N = 256
+
+@st.cache_data
+def _interval_prob(lower, upper, mu, sigma):
+    """P(lower <= X <= upper) with both tails in one vectorized CDF call."""
+    vals = _ncdf(np.array([upper, lower]), mu, sigma)
+    return float(vals[0] - vals[1])
+
+# One standard-normal grid shared by every distribution: real-space x is a
+# multiply-add away and the PDF a scalar divide. Evaluating it through
+# norm_pdf at import also doubles as the Numba warm-up for fastnorm.
+_Z = np.linspace(-4.0, 4.0, PLOT_N)
+_PHI_Z = norm_pdf(_Z, 0.0, 1.0)
+
+@st.cache_data
+def _summary(mu, sigma, z_value, p_value, prob_lower, prob_upper):
+    """One vectorized CDF pass covering the z-score, percentile, and probability tools."""
+    z_score = (z_value - mu) / sigma
+    vals = _ncdf(np.array([p_value, prob_upper, prob_lower]), mu, sigma)
+    return z_score, float(vals[0]) * 100, float(vals[1] - vals[2])
+
+@st.cache_data
+def _rule_ranges(mu, sigma):
+    return [(mu - k*sigma, mu + k*sigma) for k in (1, 2, 3)]
+
+def _overlap(mu1, sigma1, mu2, sigma2):
+    """Overlap coefficient (shared area) of two normal densities."""
+    if sigma1 == sigma2:
+        if mu1 == mu2:
+            return 1.0
+        # Equal widths: single crossing at the midpoint between the means.
+        xstar = 0.5 * (mu1 + mu2)
+        vals = _ncdf(np.array([xstar - max(mu1, mu2), xstar - min(mu1, mu2)]) / sigma1)
+        return float(vals[0] + 1.0 - vals[1])
+    # Unequal widths: the densities cross twice, at the roots of the
+    # quadratic from equating log-densities.
+    v1, v2 = sigma1 * sigma1, sigma2 * sigma2
+    a = 1.0/v1 - 1.0/v2
+    b = -2.0 * (mu1/v1 - mu2/v2)
+    c = mu1*mu1/v1 - mu2*mu2/v2 + 2.0 * math.log(sigma1/sigma2)
+    disc = math.sqrt(max(b*b - 4.0*a*c, 0.0))
+    r1, r2 = sorted(((-b - disc) / (2.0*a), (-b + disc) / (2.0*a)))
+    # Between the crossings the wider density is the smaller one; in the
+    # tails the narrower density is.
+    if sigma1 < sigma2:
+        mun, sn, muw, sw = mu1, sigma1, mu2, sigma2
+    else:
+        mun, sn, muw, sw = mu2, sigma2, mu1, sigma1
+    vals = _ncdf(np.array([(r1 - mun)/sn, (r2 - mun)/sn, (r1 - muw)/sw, (r2 - muw)/sw]))
+    return float(vals[0] + (vals[3] - vals[2]) + 1.0 - vals[1])
+
+_SIGMA_OFFSETS = np.array([-3, -2, -1, 1, 2, 3])
+
+def _sigma_bounds(mu, sigma):
+    """±1/2/3σ positions, shared by the guide lines and the range read-outs."""
+    return mu + sigma * _SIGMA_OFFSETS
+
+@st.cache_data(max_entries=64)
+def _grid(mu, sigma):
+    """Shared x-grid and PDF values for one distribution, reused across plots."""
+    return mu + sigma * _Z, _PHI_Z / sigma
+
 # Clear matplotlib configurations
-plt.style.use('default')
-plt.rcParams.update({'figure.max_open_warning': 0})
+# One-shot: Streamlit reruns the whole script, but the style merge only
+# needs to happen once per session.
+if not st.session_state.get('_mpl_inited'):
+    plt.style.use('default')
+    plt.rcParams.update({
+        'figure.max_open_warning': 0,
+        'savefig.dpi': 80,
+        'path.simplify': True,
+        'path.simplify_threshold': 1.0,
+    })
+    st.session_state['_mpl_inited'] = True
+
+@st.cache_resource
+def _fig_skeleton(figsize):
+    """One persistent Figure per size; survives script reruns via cache_resource."""
+    return plt.figure(figsize=figsize)
+
+def _get_fig(figsize):
+    """Reuse one Figure per size across rebuilds instead of reallocating."""
+    fig = _fig_skeleton(figsize)
+    fig.clear()
+    return fig, fig.add_subplot(111)
+
+def _area_patch(x, y, **kwargs):
+    """Build the closed under-curve polygon in one pass instead of fill_between's tessellation."""
+    verts = np.column_stack([np.r_[x, x[::-1]], np.r_[y, np.zeros_like(y)]])
+    return Polygon(verts, closed=True, **kwargs)
+
+def _fig_to_png(fig):
+    """Serialize a figure to PNG bytes so cached plots avoid pickling Figure objects."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png')
+    return buf.getvalue()
+
+@st.cache_data(max_entries=32)
+def _build_dist_png(mu, sigma, color, show_area, show_std_lines, show_labels,
+                    show_grid, highlight, lower_bound, upper_bound, area):
+    fig, ax = _get_fig((8, 6))
+
+    # Plot the distribution
+    x, y = _grid(mu, sigma)
+
+    ax.plot(x, y, color=color, linewidth=3, label=f'N(μ={mu}, σ={sigma})')
+
+    if show_area:
+        ax.add_patch(_area_patch(x, y, alpha=0.3, facecolor=color))
+
+    # Add mean line
+    ax.axvline(mu, color='black', linestyle='-', linewidth=2, alpha=0.7)
+
+    max_y = _INV_SQRT2PI / sigma  # analytical peak of the normal PDF
+    if show_labels:
+        ax.text(mu, max_y * 1.1, f'μ = {mu}', ha='center', fontsize=12, weight='bold')
+
+    # Add standard deviation lines
+    if show_std_lines:
+        xs = _sigma_bounds(mu, sigma)
+        ax.vlines(xs, 0, max_y, colors='orange', linestyles='--', alpha=0.6)
+        if show_labels:
+            for off, xpos in zip(_SIGMA_OFFSETS, xs):
+                ax.text(xpos, max_y * 0.1, f'{off:+d}σ', ha='center', fontsize=10)
+
+    # Highlight area if calculating
+    if highlight:
+        # x is a monotone linspace, so binary search beats a full boolean scan
+        # and the slices are zero-copy views.
+        lo = np.searchsorted(x, lower_bound)
+        hi = np.searchsorted(x, upper_bound, side='right')
+        ax.add_patch(_area_patch(x[lo:hi], y[lo:hi], alpha=0.7, facecolor='yellow', label=f'Area = {area:.4f}'))
+        ax.vlines((lower_bound, upper_bound), 0, max_y, colors='red', linestyles=':', linewidth=2)
+
+    ax.set_xlabel('x')
+    ax.set_ylabel('Probability Density')
+    ax.set_title(f'Normal Distribution: μ={mu}, σ={sigma}')
+    if show_grid:
+        ax.grid(True, alpha=0.3)
+    # Pinned legend skips the O(artists x points) 'best' placement search.
+    ax.legend(loc='upper right', fontsize='small', framealpha=0.9)
+
+    return _fig_to_png(fig)
+
+@st.cache_data(max_entries=32)
+def _build_comparison_png(mu1, sigma1, color1, mu2, sigma2, color2, show_area, show_grid):
+    fig_comp, ax_comp = _get_fig((12, 8))
+
+    # Plot both distributions
+    x1, y1 = _grid(mu1, sigma1)
+    x2, y2 = _grid(mu2, sigma2)
+
+    ax_comp.plot(x1, y1, color=color1, linewidth=3, label=f'Dist 1: N(μ={mu1}, σ={sigma1})')
+    ax_comp.plot(x2, y2, color=color2, linewidth=3, label=f'Dist 2: N(μ={mu2}, σ={sigma2})')
+
+    if show_area:
+        ax_comp.add_patch(_area_patch(x1, y1, alpha=0.2, facecolor=color1))
+        ax_comp.add_patch(_area_patch(x2, y2, alpha=0.2, facecolor=color2))
+
+    # Add mean lines, each drawn to its own curve's peak, as one collection
+    ax_comp.vlines((mu1, mu2), 0, (_INV_SQRT2PI / sigma1, _INV_SQRT2PI / sigma2),
+                   colors=(color1, color2), linewidth=2, alpha=0.8)
+
+    ax_comp.set_xlabel('x')
+    ax_comp.set_ylabel('Probability Density')
+    ax_comp.set_title('Comparison of Normal Distributions')
+    if show_grid:
+        ax_comp.grid(True, alpha=0.3)
+    ax_comp.legend(loc='upper right', fontsize='small', framealpha=0.9)
+
+    return _fig_to_png(fig_comp)
+
+# Static resource links rendered in the footer; kept as module constants so
+# reruns reuse the same strings.
+_RESOURCES_MD = (
+    """
+    **📖 Khan Academy**
+    - [Normal Distribution Intro](https://www.khanacademy.org/math/statistics-probability/modeling-distributions-of-data/normal-distributions-library)
+    - [68-95-99.7 Rule](https://www.khanacademy.org/math/statistics-probability/modeling-distributions-of-data/normal-distributions-library/v/ck12-the-empirical-rule)
+    """,
+    """
+    **🎮 Interactive Tools**
+    - [Desmos Normal Distribution](https://www.desmos.com/calculator)
+    - [GeoGebra Statistics](https://www.geogebra.org/statistics)
+    """,
+    """
+    **📊 Real Data**
+    - [StatCrunch Datasets](https://www.statcrunch.com/)
+    - [FiveThirtyEight Data](https://fivethirtyeight.com/data/)
+    """,
+    """
+    **🔬 Simulations**
+    - [PhET Probability](https://phet.colorado.edu/en/simulations/category/math)
+    - [Wolfram Demonstrations](https://demonstrations.wolfram.com/)
+    """,
+)
 
 st.title("🎯 MathCraft: Interactive Normal Distribution Explorer")
 
@@ -60,328 +256,206 @@ with control_col:
     
     if calc_area:
         which_dist = st.radio("Which distribution?", ["Distribution 1", "Distribution 2"], key="which_dist")
-        lower_bound = st.number_input("Lower bound:", value=-1.0, key="lower")
-        upper_bound = st.number_input("Upper bound:", value=1.0, key="upper")
+        lower_bound = st.number_input("Lower bound:", value=-1.0, step=0.1, key="lower")
+        upper_bound = st.number_input("Upper bound:", value=1.0, step=0.1, key="upper")
         
         # Calculate area
         if which_dist == "Distribution 1":
-            area = stats.norm.cdf(upper_bound, mu1, sigma1) - stats.norm.cdf(lower_bound, mu1, sigma1)
-            st.metric("Area (Probability)", f"{area:.4f}", f"{area*100:.2f}%")
+            area = _interval_prob(lower_bound, upper_bound, mu1, sigma1)
         else:
-            area = stats.norm.cdf(upper_bound, mu2, sigma2) - stats.norm.cdf(lower_bound, mu2, sigma2)
-            st.metric("Area (Probability)", f"{area:.4f}", f"{area*100:.2f}%")
+            area = _interval_prob(lower_bound, upper_bound, mu2, sigma2)
+        st.metric("Area (Probability)", f"{area:.4f}", f"{area*100:.2f}%")
+
+@st.fragment
+def _dist_view(idx, mu, sigma, color, show_area, show_std_lines,
+               show_labels, show_grid, highlight, lower_bound, upper_bound, area):
+    st.subheader(f"📈 Distribution {idx} View")
+    try:
+        png = _build_dist_png(mu, sigma, color, show_area, show_std_lines,
+                        show_labels, show_grid, highlight,
+                        lower_bound if highlight else 0.0,
+                        upper_bound if highlight else 0.0,
+                        area if highlight else 0.0)
+        st.image(png, use_container_width=True)
+
+        # Show key statistics
+        max_y = _INV_SQRT2PI / sigma
+        b = _sigma_bounds(mu, sigma)
+        st.markdown(f"**📊 Statistics for Distribution {idx}:**")
+        stat_cols = st.columns(3)
+        stat_cols[0].metric("Mean (μ)", f"{mu:.1f}")
+        stat_cols[1].metric("Std Dev (σ)", f"{sigma:.1f}")
+        stat_cols[2].metric("Variance (σ²)", f"{sigma**2:.3f}")
+        stat_cols = st.columns(3)
+        stat_cols[0].metric("Max Height", f"{max_y:.3f}")
+        stat_cols[1].metric("68% Range", f"[{b[2]:.2f}, {b[3]:.2f}]")
+        stat_cols[2].metric("95% Range", f"[{b[1]:.2f}, {b[4]:.2f}]")
+
+    except Exception as e:
+        st.error(f"Error creating plot: {e}")
+
+@st.fragment
+def _comparison_view(mu1, sigma1, color1, mu2, sigma2, color2, show_area, show_grid):
+    st.markdown("---")
+    st.header("⚖️ Side-by-Side Comparison")
+
+    try:
+        png_comp = _build_comparison_png(mu1, sigma1, color1, mu2, sigma2, color2,
+                                         show_area, show_grid)
+        st.image(png_comp, use_container_width=True)
+
+        # Comparison metrics
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Mean Difference", f"{abs(mu2 - mu1):.3f}")
+        with col2:
+            st.metric("Std Dev Difference", f"{abs(sigma2 - sigma1):.3f}")
+        with col3:
+            overlap_area = _overlap(mu1, sigma1, mu2, sigma2)
+            st.metric("Overlap Coefficient", f"{overlap_area:.3f}")
+
+    except Exception as e:
+        st.error(f"Error creating comparison plot: {e}")
 
 # Create the plots
 with plot_col1:
-    st.subheader("📈 Distribution 1 View")
     if show_dist1:
-        try:
-            fig1, ax1 = plt.subplots(figsize=(8, 6))
-            
-            # Plot distribution 1
-            x1 = np.linspace(mu1 - 4*sigma1, mu1 + 4*sigma1, 1000)
-            y1 = stats.norm.pdf(x1, mu1, sigma1)
-            
-            ax1.plot(x1, y1, color=color1, linewidth=3, label=f'N(μ={mu1}, σ={sigma1})')
-            
-            if show_area:
-                ax1.fill_between(x1, y1, alpha=0.3, color=color1)
-            
-            # Add mean line
-            ax1.axvline(mu1, color='black', linestyle='-', linewidth=2, alpha=0.7)
-            
-            if show_labels:
-                max_y = np.max(y1)
-                ax1.text(mu1, max_y * 1.1, f'μ = {mu1}', ha='center', fontsize=12, weight='bold')
-            
-            # Add standard deviation lines
-            if show_std_lines:
-                for i in range(1, 4):
-                    ax1.axvline(mu1 + i*sigma1, color='orange', linestyle='--', alpha=0.6)
-                    ax1.axvline(mu1 - i*sigma1, color='orange', linestyle='--', alpha=0.6)
-                    if show_labels:
-                        ax1.text(mu1 + i*sigma1, max_y * 0.1, f'+{i}σ', ha='center', fontsize=10)
-                        ax1.text(mu1 - i*sigma1, max_y * 0.1, f'-{i}σ', ha='center', fontsize=10)
-            
-            # Highlight area if calculating
-            if calc_area and which_dist == "Distribution 1":
-                x_area = x1[(x1 >= lower_bound) & (x1 <= upper_bound)]
-                y_area = stats.norm.pdf(x_area, mu1, sigma1)
-                ax1.fill_between(x_area, y_area, alpha=0.7, color='yellow', label=f'Area = {area:.4f}')
-                ax1.axvline(lower_bound, color='red', linestyle=':', linewidth=2)
-                ax1.axvline(upper_bound, color='red', linestyle=':', linewidth=2)
-            
-            ax1.set_xlabel('x')
-            ax1.set_ylabel('Probability Density')
-            ax1.set_title(f'Normal Distribution: μ={mu1}, σ={sigma1}')
-            if show_grid:
-                ax1.grid(True, alpha=0.3)
-            ax1.legend()
-            
-            st.pyplot(fig1)
-            plt.close(fig1)
-            
-            # Show key statistics
-            st.markdown(f"""
-            **📊 Statistics for Distribution 1:**
-            - Mean (μ): {mu1}
-            - Standard Deviation (σ): {sigma1}
-            - Variance (σ²): {sigma1**2:.3f}
-            - Max Height: {np.max(y1):.3f}
-            - 68% Range: [{mu1-sigma1:.2f}, {mu1+sigma1:.2f}]
-            - 95% Range: [{mu1-2*sigma1:.2f}, {mu1+2*sigma1:.2f}]
-            """)
-            
-        except Exception as e:
-            st.error(f"Error creating plot: {e}")
+        _dist_view(1, mu1, sigma1, color1, show_area, show_std_lines,
+                   show_labels, show_grid, calc_area and which_dist == "Distribution 1",
+                   lower_bound if calc_area else 0.0,
+                   upper_bound if calc_area else 0.0,
+                   area if calc_area else 0.0)
     else:
         st.info("👆 Turn on 'Show Distribution 1' to see the plot")
 
 with plot_col2:
-    st.subheader("📈 Distribution 2 View")
     if show_dist2:
-        try:
-            fig2, ax2 = plt.subplots(figsize=(8, 6))
-            
-            # Plot distribution 2
-            x2 = np.linspace(mu2 - 4*sigma2, mu2 + 4*sigma2, 1000)
-            y2 = stats.norm.pdf(x2, mu2, sigma2)
-            
-            ax2.plot(x2, y2, color=color2, linewidth=3, label=f'N(μ={mu2}, σ={sigma2})')
-            
-            if show_area:
-                ax2.fill_between(x2, y2, alpha=0.3, color=color2)
-            
-            # Add mean line
-            ax2.axvline(mu2, color='black', linestyle='-', linewidth=2, alpha=0.7)
-            
-            if show_labels:
-                max_y = np.max(y2)
-                ax2.text(mu2, max_y * 1.1, f'μ = {mu2}', ha='center', fontsize=12, weight='bold')
-            
-            # Add standard deviation lines
-            if show_std_lines:
-                for i in range(1, 4):
-                    ax2.axvline(mu2 + i*sigma2, color='orange', linestyle='--', alpha=0.6)
-                    ax2.axvline(mu2 - i*sigma2, color='orange', linestyle='--', alpha=0.6)
-                    if show_labels:
-                        ax2.text(mu2 + i*sigma2, max_y * 0.1, f'+{i}σ', ha='center', fontsize=10)
-                        ax2.text(mu2 - i*sigma2, max_y * 0.1, f'-{i}σ', ha='center', fontsize=10)
-            
-            # Highlight area if calculating
-            if calc_area and which_dist == "Distribution 2":
-                x_area = x2[(x2 >= lower_bound) & (x2 <= upper_bound)]
-                y_area = stats.norm.pdf(x_area, mu2, sigma2)
-                ax2.fill_between(x_area, y_area, alpha=0.7, color='yellow', label=f'Area = {area:.4f}')
-                ax2.axvline(lower_bound, color='red', linestyle=':', linewidth=2)
-                ax2.axvline(upper_bound, color='red', linestyle=':', linewidth=2)
-            
-            ax2.set_xlabel('x')
-            ax2.set_ylabel('Probability Density')
-            ax2.set_title(f'Normal Distribution: μ={mu2}, σ={sigma2}')
-            if show_grid:
-                ax2.grid(True, alpha=0.3)
-            ax2.legend()
-            
-            st.pyplot(fig2)
-            plt.close(fig2)
-            
-            # Show key statistics
-            st.markdown(f"""
-            **📊 Statistics for Distribution 2:**
-            - Mean (μ): {mu2}
-            - Standard Deviation (σ): {sigma2}
-            - Variance (σ²): {sigma2**2:.3f}
-            - Max Height: {np.max(y2):.3f}
-            - 68% Range: [{mu2-sigma2:.2f}, {mu2+sigma2:.2f}]
-            - 95% Range: [{mu2-2*sigma2:.2f}, {mu2+2*sigma2:.2f}]
-            """)
-            
-        except Exception as e:
-            st.error(f"Error creating plot: {e}")
+        _dist_view(2, mu2, sigma2, color2, show_area, show_std_lines,
+                   show_labels, show_grid, calc_area and which_dist == "Distribution 2",
+                   lower_bound if calc_area else 0.0,
+                   upper_bound if calc_area else 0.0,
+                   area if calc_area else 0.0)
     else:
         st.info("👆 Turn on 'Show Distribution 2' to see the plot")
 
 # Comparison View
 if show_dist1 and show_dist2:
+    _comparison_view(mu1, sigma1, color1, mu2, sigma2, color2, show_area, show_grid)
+
+# Interactive Conjecture Testing
+@st.fragment
+def _conjectures_section():
     st.markdown("---")
-    st.header("⚖️ Side-by-Side Comparison")
-    
-    try:
-        fig_comp, ax_comp = plt.subplots(figsize=(12, 8))
-        
-        # Plot both distributions
-        x1 = np.linspace(mu1 - 4*sigma1, mu1 + 4*sigma1, 1000)
-        y1 = stats.norm.pdf(x1, mu1, sigma1)
-        x2 = np.linspace(mu2 - 4*sigma2, mu2 + 4*sigma2, 1000)
-        y2 = stats.norm.pdf(x2, mu2, sigma2)
-        
-        ax_comp.plot(x1, y1, color=color1, linewidth=3, label=f'Dist 1: N(μ={mu1}, σ={sigma1})')
-        ax_comp.plot(x2, y2, color=color2, linewidth=3, label=f'Dist 2: N(μ={mu2}, σ={sigma2})')
-        
-        if show_area:
-            ax_comp.fill_between(x1, y1, alpha=0.2, color=color1)
-            ax_comp.fill_between(x2, y2, alpha=0.2, color=color2)
-        
-        # Add mean lines
-        ax_comp.axvline(mu1, color=color1, linestyle='-', linewidth=2, alpha=0.8)
-        ax_comp.axvline(mu2, color=color2, linestyle='-', linewidth=2, alpha=0.8)
-        
-        ax_comp.set_xlabel('x')
-        ax_comp.set_ylabel('Probability Density')
-        ax_comp.set_title('Comparison of Normal Distributions')
-        if show_grid:
-            ax_comp.grid(True, alpha=0.3)
-        ax_comp.legend()
-        
-        st.pyplot(fig_comp)
-        plt.close(fig_comp)
-        
-        # Comparison metrics
-        col1, col2, col3 = st.columns(3)
+    st.header("🧪 Test Your Conjectures!")
+
+    st.markdown("**Use the controls above to test these statements. Mark each as TRUE or FALSE:**")
+
+    with st.form("conjectures"):
+        col1, col2 = st.columns(2)
+
         with col1:
-            st.metric("Mean Difference", f"{abs(mu2 - mu1):.3f}")
+            st.markdown("**A.** As the mean increases, the normal curve shifts to the left.")
+            answer_a = st.radio("Your answer:", ["True", "False"], key="answer_a")
+
+            st.markdown("**B.** The standard deviation determines the width of the normal distribution.")
+            answer_b = st.radio("Your answer:", ["True", "False"], key="answer_b")
+
         with col2:
-            st.metric("Std Dev Difference", f"{abs(sigma2 - sigma1):.3f}")
-        with col3:
-            overlap_area = 0.5 * (stats.norm.cdf(min(mu1, mu2) + 2*max(sigma1, sigma2), mu1, sigma1) + 
-                                 stats.norm.cdf(min(mu1, mu2) + 2*max(sigma1, sigma2), mu2, sigma2))
-            st.metric("Approximate Overlap", f"{overlap_area:.3f}")
-            
-    except Exception as e:
-        st.error(f"Error creating comparison plot: {e}")
+            st.markdown("**C.** A normal curve with a very large mean and large standard deviation is tall and wide.")
+            answer_c = st.radio("Your answer:", ["True", "False"], key="answer_c")
 
-# Interactive Conjecture Testing
-st.markdown("---")
-st.header("🧪 Test Your Conjectures!")
+            st.markdown("**D.** The area under any normal curve is always 1.")
+            answer_d = st.radio("Your answer:", ["True", "False"], key="answer_d")
 
-st.markdown("**Use the controls above to test these statements. Mark each as TRUE or FALSE:**")
+        if st.form_submit_button("🎯 Check My Answers!"):
+            results = []
 
-col1, col2 = st.columns(2)
+            if answer_a == "False":
+                results.append("✅ A. CORRECT! The curve shifts RIGHT as mean increases.")
+            else:
+                results.append("❌ A. INCORRECT. Try increasing μ₁ and watch the curve move right!")
 
-with col1:
-    st.markdown("**A.** As the mean increases, the normal curve shifts to the left.")
-    answer_a = st.radio("Your answer:", ["True", "False"], key="answer_a")
-    
-    st.markdown("**B.** The standard deviation determines the width of the normal distribution.")
-    answer_b = st.radio("Your answer:", ["True", "False"], key="answer_b")
+            if answer_b == "True":
+                results.append("✅ B. CORRECT! Larger σ = wider curve.")
+            else:
+                results.append("❌ B. INCORRECT. Try changing σ₁ and observe the width!")
 
-with col2:
-    st.markdown("**C.** A normal curve with a very large mean and large standard deviation is tall and wide.")
-    answer_c = st.radio("Your answer:", ["True", "False"], key="answer_c")
-    
-    st.markdown("**D.** The area under any normal curve is always 1.")
-    answer_d = st.radio("Your answer:", ["True", "False"], key="answer_d")
+            if answer_c == "False":
+                results.append("✅ C. CORRECT! Large σ makes curves SHORTER and wider.")
+            else:
+                results.append("❌ C. INCORRECT. Try σ₁ = 3.0 and see the height decrease!")
 
-if st.button("🎯 Check My Answers!"):
-    results = []
-    
-    if answer_a == "False":
-        results.append("✅ A. CORRECT! The curve shifts RIGHT as mean increases.")
-    else:
-        results.append("❌ A. INCORRECT. Try increasing μ₁ and watch the curve move right!")
-    
-    if answer_b == "True":
-        results.append("✅ B. CORRECT! Larger σ = wider curve.")
-    else:
-        results.append("❌ B. INCORRECT. Try changing σ₁ and observe the width!")
-    
-    if answer_c == "False":
-        results.append("✅ C. CORRECT! Large σ makes curves SHORTER and wider.")
-    else:
-        results.append("❌ C. INCORRECT. Try σ₁ = 3.0 and see the height decrease!")
-    
-    if answer_d == "True":
-        results.append("✅ D. CORRECT! All normal curves have area = 1.")
-    else:
-        results.append("❌ D. INCORRECT. This is always true for any normal distribution!")
-    
-    for result in results:
-        st.write(result)
+            if answer_d == "True":
+                results.append("✅ D. CORRECT! All normal curves have area = 1.")
+            else:
+                results.append("❌ D. INCORRECT. This is always true for any normal distribution!")
+
+            for result in results:
+                st.write(result)
+
+_conjectures_section()
 
 # Quick Tools Section
-st.markdown("---")
-st.header("🛠️ Quick Tools")
+@st.fragment
+def _tools_section():
+    st.markdown("---")
+    st.header("🛠️ Quick Tools")
 
-tool_tabs = st.tabs(["📊 Z-Score Calculator", "📈 Percentile Finder", "🎯 Probability Calculator", "📋 68-95-99.7 Rule"])
+    # One shared (μ, σ) context feeds all four tools, so a single vectorized
+    # CDF call covers the whole section.
+    mu_col, sigma_col = st.columns(2)
+    with mu_col:
+        tool_mu = st.number_input("Mean (μ):", value=0.0, step=0.1, key="tool_mu")
+    with sigma_col:
+        tool_sigma = st.number_input("Std Dev (σ):", value=1.0, min_value=0.1, step=0.1, key="tool_sigma")
 
-with tool_tabs[0]:
-    st.subheader("Calculate Z-Score")
-    z_value = st.number_input("Enter value (x):", value=1.5, key="z_val")
-    z_mu = st.number_input("Mean (μ):", value=0.0, key="z_mu")
-    z_sigma = st.number_input("Std Dev (σ):", value=1.0, min_value=0.1, key="z_sigma")
-    
-    z_score = (z_value - z_mu) / z_sigma
-    st.metric("Z-Score", f"{z_score:.4f}")
-    st.write(f"This value is {abs(z_score):.2f} standard deviations {'above' if z_score > 0 else 'below'} the mean.")
-
-with tool_tabs[1]:
-    st.subheader("Find Percentile")
-    p_value = st.number_input("Enter value:", value=1.0, key="p_val")
-    p_mu = st.number_input("Mean:", value=0.0, key="p_mu")
-    p_sigma = st.number_input("Std Dev:", value=1.0, min_value=0.1, key="p_sigma")
-    
-    percentile = stats.norm.cdf(p_value, p_mu, p_sigma) * 100
-    st.metric("Percentile", f"{percentile:.2f}%")
-    st.write(f"{percentile:.1f}% of values are below {p_value}")
-
-with tool_tabs[2]:
-    st.subheader("Calculate Probability")
-    prob_mu = st.number_input("Mean:", value=0.0, key="prob_mu")
-    prob_sigma = st.number_input("Std Dev:", value=1.0, min_value=0.1, key="prob_sigma")
-    prob_lower = st.number_input("Lower bound:", value=-1.0, key="prob_lower")
-    prob_upper = st.number_input("Upper bound:", value=1.0, key="prob_upper")
-    
-    probability = stats.norm.cdf(prob_upper, prob_mu, prob_sigma) - stats.norm.cdf(prob_lower, prob_mu, prob_sigma)
-    st.metric("Probability", f"{probability:.4f}")
-    st.metric("Percentage", f"{probability*100:.2f}%")
-
-with tool_tabs[3]:
-    st.subheader("68-95-99.7 Rule Visualizer")
-    rule_mu = st.number_input("Mean:", value=0.0, key="rule_mu")
-    rule_sigma = st.number_input("Std Dev:", value=1.0, min_value=0.1, key="rule_sigma")
-    
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("68% Range", f"[{rule_mu-rule_sigma:.2f}, {rule_mu+rule_sigma:.2f}]")
-    with col2:
-        st.metric("95% Range", f"[{rule_mu-2*rule_sigma:.2f}, {rule_mu+2*rule_sigma:.2f}]")
-    with col3:
-        st.metric("99.7% Range", f"[{rule_mu-3*rule_sigma:.2f}, {rule_mu+3*rule_sigma:.2f}]")
+    tool_tabs = st.tabs(["📊 Z-Score Calculator", "📈 Percentile Finder", "🎯 Probability Calculator", "📋 68-95-99.7 Rule"])
 
-# Educational Links and Resources
-st.markdown("---")
-st.header("📚 Learn More")
+    with tool_tabs[0]:
+        st.subheader("Calculate Z-Score")
+        z_value = st.number_input("Enter value (x):", value=1.5, step=0.1, key="z_val")
 
-resource_cols = st.columns(4)
+    with tool_tabs[1]:
+        st.subheader("Find Percentile")
+        p_value = st.number_input("Enter value:", value=1.0, step=0.1, key="p_val")
 
-with resource_cols[0]:
-    st.markdown("""
-    **📖 Khan Academy**
-    - [Normal Distribution Intro](https://www.khanacademy.org/math/statistics-probability/modeling-distributions-of-data/normal-distributions-library)
-    - [68-95-99.7 Rule](https://www.khanacademy.org/math/statistics-probability/modeling-distributions-of-data/normal-distributions-library/v/ck12-the-empirical-rule)
-    """)
+    with tool_tabs[2]:
+        st.subheader("Calculate Probability")
+        prob_lower = st.number_input("Lower bound:", value=-1.0, step=0.1, key="prob_lower")
+        prob_upper = st.number_input("Upper bound:", value=1.0, step=0.1, key="prob_upper")
 
-with resource_cols[1]:
-    st.markdown("""
-    **🎮 Interactive Tools**
-    - [Desmos Normal Distribution](https://www.desmos.com/calculator)
-    - [GeoGebra Statistics](https://www.geogebra.org/statistics)
-    """)
+    z_score, percentile, probability = _summary(tool_mu, tool_sigma, z_value,
+                                                p_value, prob_lower, prob_upper)
 
-with resource_cols[2]:
-    st.markdown("""
-    **📊 Real Data**
-    - [StatCrunch Datasets](https://www.statcrunch.com/)
-    - [FiveThirtyEight Data](https://fivethirtyeight.com/data/)
-    """)
+    with tool_tabs[0]:
+        st.metric("Z-Score", f"{z_score:.4f}")
+        st.write(f"This value is {abs(z_score):.2f} standard deviations {'above' if z_score > 0 else 'below'} the mean.")
 
-with resource_cols[3]:
-    st.markdown("""
-    **🔬 Simulations**
-    - [PhET Probability](https://phet.colorado.edu/en/simulations/category/math)
-    - [Wolfram Demonstrations](https://demonstrations.wolfram.com/)
-    """)
+    with tool_tabs[1]:
+        st.metric("Percentile", f"{percentile:.2f}%")
+        st.write(f"{percentile:.1f}% of values are below {p_value}")
+
+    with tool_tabs[2]:
+        st.metric("Probability", f"{probability:.4f}")
+        st.metric("Percentage", f"{probability*100:.2f}%")
+
+    with tool_tabs[3]:
+        st.subheader("68-95-99.7 Rule Visualizer")
+        ranges = _rule_ranges(tool_mu, tool_sigma)
+        col1, col2, col3 = st.columns(3)
+        for col, label, (lo, hi) in zip((col1, col2, col3), ("68% Range", "95% Range", "99.7% Range"), ranges):
+            with col:
+                st.metric(label, f"[{lo:.2f}, {hi:.2f}]")
+
+_tools_section()
+
+# Educational Links and Resources
+st.markdown("---")
+st.header("📚 Learn More")
+
+for col, md in zip(st.columns(len(_RESOURCES_MD)), _RESOURCES_MD):
+    with col:
+        st.markdown(md)
 
 st.markdown("---")
 st.markdown("*🎯 MathCraft: Making mathematics interactive, engaging, and meaningful through hands-on exploration!*")